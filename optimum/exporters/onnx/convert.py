@@ -1063,7 +1063,7 @@ def onnx_export_from_model(
 
     if library_name != "diffusers" and model_type in TasksManager._UNSUPPORTED_CLI_MODEL_TYPE:
         raise ValueError(
-            f"{model_type} is not supported yet. Only {list(TasksManager._SUPPORTED_CLI_MODEL_TYPE.keys())} are supported. "
+            f"{model_type} is not supported yet. Only {sorted(TasksManager._SUPPORTED_CLI_MODEL_TYPE)} are supported. "
             f"If you want to support {model_type} please propose a PR or open up an issue."
         )
 
@@ -18,9 +18,28 @@ import importlib
 import inspect
 import itertools
 import os
-from functools import partial
+import re
+import time
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import huggingface_hub
 from huggingface_hub.constants import HUGGINGFACE_HUB_CACHE
@@ -34,6 +53,8 @@ from ..utils.import_utils import is_onnx_available
 
 
 if TYPE_CHECKING:
+    from transformers import PreTrainedModel, TFPreTrainedModel
+
     from .base import ExportConfig
 
 
@@ -47,15 +68,25 @@ if not is_torch_available() and not is_tf_available():
 
 if is_torch_available():
     import torch
-    from transformers import PreTrainedModel
 
-if is_tf_available():
-    from transformers import TFPreTrainedModel
+_WITH_PAST_SUFFIX = "-with-past"
+
+_PT_WEIGHT_NAME, _PT_WEIGHT_EXTENSION = os.path.splitext(WEIGHTS_NAME)
+_SAFE_WEIGHT_NAME, _SAFE_WEIGHT_EXTENSION = os.path.splitext(SAFE_WEIGHTS_NAME)
+_TF_WEIGHT_NAME, _TF_WEIGHT_EXTENSION = os.path.splitext(TF2_WEIGHTS_NAME)
+
+# Weight files are matched on their name prefix and extension, e.g. `pytorch_model-00001-of-00002.bin`.
+_PT_WEIGHT_FILE_PATTERN = re.compile(
+    f"{re.escape(_PT_WEIGHT_NAME)}.*{re.escape(_PT_WEIGHT_EXTENSION)}"
+    f"|{re.escape(_SAFE_WEIGHT_NAME)}.*{re.escape(_SAFE_WEIGHT_EXTENSION)}"
+)
+_TF_WEIGHT_FILE_PATTERN = re.compile(f"{re.escape(_TF_WEIGHT_NAME)}.*{re.escape(_TF_WEIGHT_EXTENSION)}")
 
 ExportConfigConstructor = Callable[[PretrainedConfig], "ExportConfig"]
 TaskNameToExportConfigDict = Dict[str, ExportConfigConstructor]
 
 
+@lru_cache(maxsize=None)
 def is_backend_available(backend):
     backend_availablilty = {
         "onnx": is_onnx_available(),
@@ -64,22 +95,184 @@ def is_backend_available(backend):
     return backend_availablilty[backend]
 
 
+@lru_cache(maxsize=None)
+def _get_model_configs_module(backend: str):
+    """
+    Returns the `optimum.exporters.{backend}.model_configs` module.
+    """
+    return importlib.import_module(f"optimum.exporters.{backend}.model_configs")
+
+
+def _list_relative_file_paths(directory: Union[str, Path]) -> List[str]:
+    """
+    Lists the paths of all the files under `directory`, relative to it.
+    """
+    root = str(directory)
+    relative_file_paths = []
+    relative_directories = [""]
+    while relative_directories:
+        relative_directory = relative_directories.pop()
+        try:
+            entries = os.scandir(os.path.join(root, relative_directory))
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                relative_path = os.path.join(relative_directory, entry.name) if relative_directory else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    relative_file_paths.append(relative_path)
+                elif not entry.is_symlink():
+                    # Like `os.walk`, symbolic links to directories are not followed.
+                    relative_directories.append(relative_path)
+    return relative_file_paths
+
+
+@lru_cache(maxsize=None)
+def _get_transformers_auto_modules():
+    """
+    Returns the PyTorch and TensorFlow `transformers` auto modeling modules.
+    """
+    return (
+        importlib.import_module("transformers.models.auto.modeling_auto"),
+        importlib.import_module("transformers.models.auto.modeling_tf_auto"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _split_with_past_task(task: str) -> Tuple[str, bool]:
+    """
+    Splits a task name into its base task and whether it is a `-with-past` task, e.g. `"text-generation-with-past"`
+    becomes `("text-generation", True)`.
+    """
+    if task.endswith(_WITH_PAST_SUFFIX):
+        return task[: -len(_WITH_PAST_SUFFIX)], True
+    return task, False
+
+
+@lru_cache(maxsize=None)
+def _normalize_model_type(model_type: str) -> str:
+    """
+    Normalizes a model type to the form used as key in the `TasksManager` registries, e.g. `"Speech_to_Text"` becomes
+    `"speech-to-text"`.
+    """
+    return model_type.lower().replace("_", "-")
+
+
+@lru_cache(maxsize=None)
 def make_backend_config_constructor_for_task(config_cls: Type, task: str) -> ExportConfigConstructor:
-    if "-with-past" in task:
+    base_task, use_past = _split_with_past_task(task)
+    if use_past:
         if not getattr(config_cls, "SUPPORTS_PAST", False):
             raise ValueError(f"{config_cls} does not support tasks with past.")
-        constructor = partial(config_cls, use_past=True, task=task.replace("-with-past", ""))
+        constructor = partial(config_cls, use_past=True, task=base_task)
     else:
         constructor = partial(config_cls, task=task)
     return constructor
 
 
+@lru_cache(maxsize=None)
+def _normalize_supported_tasks(
+    supported_tasks: Tuple[Union[str, Tuple[str, Tuple[str, ...]]], ...]
+) -> Tuple[Tuple[str, Optional[FrozenSet[str]]], ...]:
+    """
+    Normalizes the tasks passed to `supported_tasks_mapping` to `(task, supported_backends)` pairs, where
+    `supported_backends` is `None` when the task is supported by every backend. Model types declaring the same tasks
+    share the same normalized tuple.
+    """
+    return tuple((task, None) if isinstance(task, str) else (task[0], frozenset(task[1])) for task in supported_tasks)
+
+
+class _LazyBackendMapping(MutableMapping):
+    """
+    A `backend -> TaskNameToExportConfigDict` mapping for a given model, where the `ExportConfig` class of a backend
+    (and thus the backend `model_configs` module) is only imported the first time the tasks of this backend are
+    requested.
+    """
+
+    def __init__(
+        self, supported_tasks: Tuple[Union[str, Tuple[str, Tuple[str, ...]]], ...], exporters: Dict[str, str]
+    ):
+        self._supported_tasks = _normalize_supported_tasks(supported_tasks)
+        self._config_cls_names = {
+            backend: config_cls_name for backend, config_cls_name in exporters.items() if is_backend_available(backend)
+        }
+        self._mapping = {}
+
+    def _load_backend(self, backend: str) -> TaskNameToExportConfigDict:
+        config_cls = getattr(_get_model_configs_module(backend), self._config_cls_names[backend])
+        mapping = {}
+        for task, supported_backends_for_task in self._supported_tasks:
+            if supported_backends_for_task is not None and backend not in supported_backends_for_task:
+                continue
+            mapping[task] = make_backend_config_constructor_for_task(config_cls, task)
+        return mapping
+
+    def get_task_names(self, backend: str) -> Iterable[str]:
+        """
+        Returns the tasks supported for the backend, without resolving its `ExportConfig` class if it was not loaded
+        yet.
+        """
+        if backend in self._mapping:
+            return self._mapping[backend].keys()
+        if backend not in self._config_cls_names:
+            raise KeyError(backend)
+        # A task can be declared several times for a model type, the resolved dictionary only keeps it once.
+        return dict.fromkeys(
+            task
+            for task, supported_backends_for_task in self._supported_tasks
+            if supported_backends_for_task is None or backend in supported_backends_for_task
+        ).keys()
+
+    def __getitem__(self, backend: str) -> TaskNameToExportConfigDict:
+        if backend not in self._mapping:
+            if backend not in self._config_cls_names:
+                raise KeyError(backend)
+            self._mapping[backend] = self._load_backend(backend)
+        return self._mapping[backend]
+
+    def __setitem__(self, backend: str, value: TaskNameToExportConfigDict):
+        self._mapping[backend] = value
+
+    def __delitem__(self, backend: str):
+        if backend not in self:
+            raise KeyError(backend)
+        self._mapping.pop(backend, None)
+        self._config_cls_names.pop(backend, None)
+
+    def __contains__(self, backend: object) -> bool:
+        return backend in self._mapping or backend in self._config_cls_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(itertools.chain(self._config_cls_names, self._mapping)))
+
+    def __len__(self) -> int:
+        return len(self._config_cls_names.keys() | self._mapping.keys())
+
+    def __repr__(self) -> str:
+        pending = {backend: name for backend, name in self._config_cls_names.items() if backend not in self._mapping}
+        return f"{self.__class__.__name__}(loaded={self._mapping}, pending={pending})"
+
+
+def _get_supported_task_names(mapping: MutableMapping[str, TaskNameToExportConfigDict], backend: str) -> Iterable[str]:
+    """
+    Returns the tasks supported by a model for the backend, only resolving the `ExportConfig` classes when `mapping`
+    is not lazily loaded.
+    """
+    if isinstance(mapping, _LazyBackendMapping):
+        return mapping.get_task_names(backend)
+    return mapping[backend].keys()
+
+
 def supported_tasks_mapping(
     *supported_tasks: Union[str, Tuple[str, Tuple[str, ...]]], **exporters: str
-) -> Dict[str, TaskNameToExportConfigDict]:
+) -> MutableMapping[str, TaskNameToExportConfigDict]:
     """
     Generates the mapping between supported tasks and their corresponding `ExportConfig` for a given model, for
-    every backend.
+    every backend. The `ExportConfig` classes are only imported when the tasks of their backend are first accessed.
 
     Args:
         supported_tasks (`Tuple[Union[str, Tuple[str, Tuple[str, ...]]]`):
@@ -102,23 +295,11 @@ def supported_tasks_mapping(
             ```
 
     Returns:
-        `Dict[str, TaskNameToExportConfigDict]`: The dictionary mapping a task to an `ExportConfig` constructor.
+        `MutableMapping[str, TaskNameToExportConfigDict]`: The mapping between each available backend and the
+        dictionary mapping a task to an `ExportConfig` constructor. It is not a `dict`: the backends are only loaded on
+        access.
     """
-    mapping = {}
-    for backend, config_cls_name in exporters.items():
-        if is_backend_available(backend):
-            config_cls = getattr(
-                importlib.import_module(f"optimum.exporters.{backend}.model_configs"), config_cls_name
-            )
-            mapping[backend] = {}
-            for task in supported_tasks:
-                if isinstance(task, tuple):
-                    task, supported_backends_for_task = task
-                    if backend not in supported_backends_for_task:
-                        continue
-                config_constructor = make_backend_config_constructor_for_task(config_cls, task)
-                mapping[backend][task] = config_constructor
-    return mapping
+    return _LazyBackendMapping(supported_tasks, exporters)
 
 
 def get_model_loaders_to_tasks(tasks_to_model_loaders: Dict[str, Union[str, Tuple[str]]]) -> Dict[str, str]:
@@ -126,14 +307,91 @@ def get_model_loaders_to_tasks(tasks_to_model_loaders: Dict[str, Union[str, Tupl
     Reverses tasks_to_model_loaders while flattening the case where the same task maps to several
     auto classes (e.g. automatic-speech-recognition).
     """
-    model_loaders_to_tasks = {}
-    for task, model_loaders in tasks_to_model_loaders.items():
-        if isinstance(model_loaders, str):
-            model_loaders_to_tasks[model_loaders] = task
-        else:
-            model_loaders_to_tasks.update({model_loader_name: task for model_loader_name in model_loaders})
+    return {
+        model_loader_name: task
+        for task, model_loaders in tasks_to_model_loaders.items()
+        for model_loader_name in ((model_loaders,) if isinstance(model_loaders, str) else model_loaders)
+    }
 
-    return model_loaders_to_tasks
+
+# Listings of Hub repositories are reused for a short while by the framework and library inference, as the same
+# repository is usually listed several times during a single export.
+_HUB_REPO_FILES_CACHE_TTL = 60
+_HUB_REPO_FILES_CACHE_MAXSIZE = 32
+_HUB_REPO_FILES_CACHE: "OrderedDict[Tuple[str, str, Optional[str], Optional[str]], Tuple[float, Tuple[str, ...]]]" = (
+    OrderedDict()
+)
+
+
+def _list_hub_repo_files(
+    repo_id: str,
+    subfolder: str = "",
+    token: Optional[str] = None,
+    revision: Optional[str] = None,
+    use_cache: bool = False,
+) -> List[str]:
+    """
+    Lists the files of a Hub model repository, relative to `subfolder`. If `use_cache=True`, the listing is reused for
+    `_HUB_REPO_FILES_CACHE_TTL` seconds.
+    """
+    cache_key = (repo_id, subfolder, token, revision)
+    if use_cache:
+        cached = _HUB_REPO_FILES_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _HUB_REPO_FILES_CACHE_TTL:
+            _HUB_REPO_FILES_CACHE.move_to_end(cache_key)
+            return list(cached[1])
+
+    if subfolder != "" and version.parse(huggingface_hub.__version__) >= version.parse("0.20.0"):
+        from huggingface_hub.hf_api import RepoFile
+
+        # Only list the files under the subfolder rather than the whole repository.
+        try:
+            all_files = [
+                entry.path[len(subfolder) + 1 :]
+                for entry in huggingface_hub.list_repo_tree(
+                    repo_id,
+                    path_in_repo=subfolder,
+                    recursive=True,
+                    repo_type="model",
+                    token=token,
+                    revision=revision,
+                )
+                if isinstance(entry, RepoFile)
+            ]
+        except huggingface_hub.utils.EntryNotFoundError:
+            all_files = []
+    else:
+        all_files = huggingface_hub.list_repo_files(
+            repo_id,
+            repo_type="model",
+            token=token,
+            revision=revision,
+        )
+        if subfolder != "":
+            all_files = [file[len(subfolder) + 1 :] for file in all_files if file.startswith(subfolder)]
+
+    # Listings are stored even when not requested from the cache, so that the most recent one is always reused.
+    _HUB_REPO_FILES_CACHE[cache_key] = (time.monotonic(), tuple(all_files))
+    _HUB_REPO_FILES_CACHE.move_to_end(cache_key)
+    if len(_HUB_REPO_FILES_CACHE) > _HUB_REPO_FILES_CACHE_MAXSIZE:
+        _HUB_REPO_FILES_CACHE.popitem(last=False)
+    return all_files
+
+
+@lru_cache(maxsize=None)
+def _get_autoclass_name_for_model_type(
+    library: str, autoclass_names: Tuple[str, ...], model_type: str
+) -> Optional[str]:
+    """
+    Returns the first of `autoclass_names` whose model mapping supports `model_type`, or `None` if none does.
+    """
+    loaded_library = importlib.import_module(library)
+    for autoclass_name in autoclass_names:
+        model_mapping = getattr(loaded_library, autoclass_name)._model_mapping._model_mapping
+        # TODO: we must really get rid of this - and _ mess
+        if model_type in model_mapping or model_type.replace("-", "_") in model_mapping:
+            return autoclass_name
+    return None
 
 
 class TasksManager:
@@ -280,13 +538,15 @@ class TasksManager:
     }
 
     # TODO: why feature-extraction-with-past is here?
-    _ENCODER_DECODER_TASKS = (
-        "automatic-speech-recognition",
-        "document-question-answering",
-        "feature-extraction-with-past",
-        "image-to-text",
-        "text2text-generation",
-        "visual-question-answering",
+    _ENCODER_DECODER_TASKS = frozenset(
+        {
+            "automatic-speech-recognition",
+            "document-question-answering",
+            "feature-extraction-with-past",
+            "image-to-text",
+            "text2text-generation",
+            "visual-question-answering",
+        }
     )
 
     _MODEL_TYPE_FOR_DEFAULT_CONFIG = {
@@ -1124,6 +1384,13 @@ class TasksManager:
         "timm": _TIMM_SUPPORTED_MODEL_TYPE,
         "transformers": _SUPPORTED_MODEL_TYPE,
     }
+    # Used when no library name is specified. A view rather than a merged copy, transformers taking precedence.
+    _ALL_LIBRARIES_SUPPORTED_MODEL_TYPE = ChainMap(
+        _SUPPORTED_MODEL_TYPE,
+        _SENTENCE_TRANSFORMERS_SUPPORTED_MODEL_TYPE,
+        _TIMM_SUPPORTED_MODEL_TYPE,
+        _DIFFUSERS_SUPPORTED_MODEL_TYPE,
+    )
     _UNSUPPORTED_CLI_MODEL_TYPE = {
         "unet",
         "vae-encoder",
@@ -1133,11 +1400,23 @@ class TasksManager:
         "trocr",  # TODO: why?
     }
     _SUPPORTED_CLI_MODEL_TYPE = (
-        set(_SUPPORTED_MODEL_TYPE.keys())
-        | set(_DIFFUSERS_SUPPORTED_MODEL_TYPE.keys())
-        | set(_TIMM_SUPPORTED_MODEL_TYPE.keys())
-        | set(_SENTENCE_TRANSFORMERS_SUPPORTED_MODEL_TYPE.keys())
-    ) - _UNSUPPORTED_CLI_MODEL_TYPE
+        set(
+            itertools.chain(
+                _SUPPORTED_MODEL_TYPE,
+                _DIFFUSERS_SUPPORTED_MODEL_TYPE,
+                _TIMM_SUPPORTED_MODEL_TYPE,
+                _SENTENCE_TRANSFORMERS_SUPPORTED_MODEL_TYPE,
+            )
+        )
+        - _UNSUPPORTED_CLI_MODEL_TYPE
+    )
+
+    # Lazily built by `get_supported_model_type_for_task`.
+    _MODEL_TYPES_FOR_EXPORTER_AND_TASK = None
+    # Lazily built by `synonyms_for_task`.
+    _TASK_TO_SYNONYMS = None
+    # Lazily built by `_get_class_name_to_task_indices`.
+    _CLASS_NAME_TO_TASK_INDICES = None
 
     @classmethod
     def create_register(
@@ -1177,7 +1456,7 @@ class TasksManager:
                 mapping = supported_model_type_for_library.get(model_type, {})
                 mapping_backend = mapping.get(backend, {})
                 for task in supported_tasks:
-                    normalized_task = task.replace("-with-past", "")
+                    normalized_task, _ = _split_with_past_task(task)
                     if normalized_task not in cls.get_all_tasks():
                         known_tasks = ", ".join(cls.get_all_tasks())
                         raise ValueError(
@@ -1188,6 +1467,7 @@ class TasksManager:
                     mapping_backend[task] = make_backend_config_constructor_for_task(config_cls, task)
                 mapping[backend] = mapping_backend
                 supported_model_type_for_library[model_type] = mapping
+                TasksManager._MODEL_TYPES_FOR_EXPORTER_AND_TASK = None
                 return config_cls
 
             return decorator
@@ -1221,17 +1501,12 @@ class TasksManager:
             )
 
             # We are screwed if different dictionaries have the same keys.
-            supported_model_type_for_library = {
-                **TasksManager._DIFFUSERS_SUPPORTED_MODEL_TYPE,
-                **TasksManager._TIMM_SUPPORTED_MODEL_TYPE,
-                **TasksManager._SENTENCE_TRANSFORMERS_SUPPORTED_MODEL_TYPE,
-                **TasksManager._SUPPORTED_MODEL_TYPE,
-            }
+            supported_model_type_for_library = TasksManager._ALL_LIBRARIES_SUPPORTED_MODEL_TYPE
             library_name = "transformers"
         else:
             supported_model_type_for_library = TasksManager._LIBRARY_TO_SUPPORTED_MODEL_TYPES[library_name]
 
-        model_type = model_type.lower().replace("_", "-")
+        model_type = _normalize_model_type(model_type)
         model_type_and_model_name = f"{model_type} ({model_name})" if model_name else model_type
 
         default_model_type = None
@@ -1261,28 +1536,55 @@ class TasksManager:
         """
         Returns the list of supported architectures by the exporter for a given task. Transformers-specific.
         """
-        return [
-            model_type.replace("-", "_")
-            for model_type in TasksManager._SUPPORTED_MODEL_TYPE
-            if task in TasksManager._SUPPORTED_MODEL_TYPE[model_type][exporter]
-        ]
+        if TasksManager._MODEL_TYPES_FOR_EXPORTER_AND_TASK is None:
+            # Built in a single pass over the registry, and reset whenever a new config is registered.
+            model_types_for_exporter_and_task = {}
+            for model_type, mapping in TasksManager._SUPPORTED_MODEL_TYPE.items():
+                model_type = model_type.replace("-", "_")
+                for backend in mapping:
+                    for supported_task in _get_supported_task_names(mapping, backend):
+                        model_types_for_exporter_and_task.setdefault((backend, supported_task), []).append(model_type)
+            TasksManager._MODEL_TYPES_FOR_EXPORTER_AND_TASK = model_types_for_exporter_and_task
+
+        return list(TasksManager._MODEL_TYPES_FOR_EXPORTER_AND_TASK.get((exporter, task), []))
 
     @staticmethod
     def synonyms_for_task(task: str) -> Set[str]:
-        synonyms = [k for k, v in TasksManager._SYNONYM_TASK_MAP.items() if v == task]
-        synonyms += [k for k, v in TasksManager._SYNONYM_TASK_MAP.items() if v == TasksManager.map_from_synonym(task)]
-        synonyms = set(synonyms)
-        try:
-            synonyms.remove(task)
-        except KeyError:
-            pass
-        return synonyms
+        if TasksManager._TASK_TO_SYNONYMS is None:
+            task_to_synonyms = {}
+            for synonym, target_task in TasksManager._SYNONYM_TASK_MAP.items():
+                task_to_synonyms.setdefault(target_task, set()).add(synonym)
+            TasksManager._TASK_TO_SYNONYMS = {
+                target_task: frozenset(synonyms) for target_task, synonyms in task_to_synonyms.items()
+            }
+
+        empty = frozenset()
+        synonyms = TasksManager._TASK_TO_SYNONYMS.get(task, empty) | TasksManager._TASK_TO_SYNONYMS.get(
+            TasksManager.map_from_synonym(task), empty
+        )
+        return set(synonyms - {task})
 
     @staticmethod
     def map_from_synonym(task: str) -> str:
-        if task in TasksManager._SYNONYM_TASK_MAP:
-            task = TasksManager._SYNONYM_TASK_MAP[task]
-        return task
+        return TasksManager._SYNONYM_TASK_MAP.get(task, task)
+
+    @staticmethod
+    def _is_encoder_decoder_task(task: str) -> bool:
+        """
+        Whether the task, with or without its `-with-past` suffix, is exported as separate encoder and decoder models.
+        """
+        base_task, _ = _split_with_past_task(task)
+        return task in TasksManager._ENCODER_DECODER_TASKS or base_task in TasksManager._ENCODER_DECODER_TASKS
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_base_task(task: str) -> str:
+        """
+        Returns the canonical name of a task, without its `-with-past` suffix and with synonyms resolved, e.g.
+        `"causal-lm-with-past"` becomes `"text-generation"`.
+        """
+        task, _ = _split_with_past_task(task)
+        return TasksManager.map_from_synonym(task)
 
     @staticmethod
     def _validate_framework_choice(framework: str):
@@ -1326,13 +1628,13 @@ class TasksManager:
         Returns:
             The AutoModel class corresponding to the task.
         """
-        task = task.replace("-with-past", "")
-        task = TasksManager.map_from_synonym(task)
+        task = TasksManager._get_base_task(task)
 
         TasksManager._validate_framework_choice(framework)
 
-        if (framework, model_type, task) in TasksManager._CUSTOM_CLASSES:
-            library, class_name = TasksManager._CUSTOM_CLASSES[(framework, model_type, task)]
+        custom_class = TasksManager._CUSTOM_CLASSES.get((framework, model_type, task))
+        if custom_class is not None:
+            library, class_name = custom_class
             loaded_library = importlib.import_module(library)
 
             return getattr(loaded_library, class_name)
@@ -1351,32 +1653,26 @@ class TasksManager:
                         + ", ".join([f"`{key}` for {tasks_to_model_loader[key]}" for key in tasks_to_model_loader])
                     )
 
-                if isinstance(tasks_to_model_loader[task], str):
-                    model_class_name = tasks_to_model_loader[task]
+                model_loaders = tasks_to_model_loader[task]
+                if isinstance(model_loaders, str):
+                    model_class_name = model_loaders
                 else:
                     # automatic-speech-recognition case, which may map to several auto class
                     if library == "transformers":
                         if model_type is None:
                             logger.warning(
                                 f"No model type passed for the task {task}, that may be mapped to several loading"
-                                f" classes ({tasks_to_model_loader[task]}). Defaulting to {tasks_to_model_loader[task][0]}"
+                                f" classes ({model_loaders}). Defaulting to {model_loaders[0]}"
                                 " to load the model."
                             )
-                            model_class_name = tasks_to_model_loader[task][0]
+                            model_class_name = model_loaders[0]
                         else:
-                            for autoclass_name in tasks_to_model_loader[task]:
-                                module = getattr(loaded_library, autoclass_name)
-                                # TODO: we must really get rid of this - and _ mess
-                                if (
-                                    model_type in module._model_mapping._model_mapping
-                                    or model_type.replace("-", "_") in module._model_mapping._model_mapping
-                                ):
-                                    model_class_name = autoclass_name
-                                    break
-
+                            model_class_name = _get_autoclass_name_for_model_type(
+                                library, tuple(model_loaders), model_type
+                            )
                             if model_class_name is None:
                                 raise ValueError(
-                                    f"Unrecognized configuration classes {tasks_to_model_loader[task]} do not match"
+                                    f"Unrecognized configuration classes {model_loaders} do not match"
                                     f" with the model type {model_type} and task {task}."
                                 )
                     else:
@@ -1393,27 +1689,44 @@ class TasksManager:
         cache_dir: str = HUGGINGFACE_HUB_CACHE,
         use_auth_token: Optional[str] = None,
         revision: Optional[str] = None,
+        use_cache: bool = False,
     ):
+        """
+        Lists the files of a local model directory or of a Hub model repository, falling back on the local cache when
+        the Hub can not be reached.
+
+        Args:
+            model_name_or_path (`Union[str, Path]`):
+                Can be either the model id of a model repo on the Hugging Face Hub, or a path to a local directory
+                containing a model.
+            subfolder (`str`, defaults to `""`):
+                In case the model files are located inside a subfolder of the model directory / repo on the Hugging
+                Face Hub, you can specify the subfolder name here.
+            cache_dir (`Optional[str]`, *optional*):
+                Path to a directory in which a downloaded pretrained model weights have been cached if the standard cache should not be used.
+            use_auth_token (`Optional[str]`, defaults to `None`):
+                The token to use as HTTP bearer authorization for remote files.
+            revision (`Optional[str]`, defaults to `None`):
+                Revision is the specific model version to use. It can be a branch name, a tag name, or a commit id.
+            use_cache (`bool`, defaults to `False`):
+                Whether a listing of the Hub repository made in the last `_HUB_REPO_FILES_CACHE_TTL` seconds can be
+                reused instead of requesting the Hub again.
+
+        Returns:
+            `Tuple[List[str], Optional[Exception]]`: The files of the model, relative to `subfolder`, and the exception
+            raised when requesting the Hub, if any.
+        """
         request_exception = None
         full_model_path = Path(model_name_or_path) / subfolder
         if full_model_path.is_dir():
-            all_files = [
-                os.path.relpath(os.path.join(dirpath, file), full_model_path)
-                for dirpath, _, filenames in os.walk(full_model_path)
-                for file in filenames
-            ]
+            all_files = _list_relative_file_paths(full_model_path)
         else:
             try:
                 if not isinstance(model_name_or_path, str):
                     model_name_or_path = str(model_name_or_path)
-                all_files = huggingface_hub.list_repo_files(
-                    model_name_or_path,
-                    repo_type="model",
-                    token=use_auth_token,
-                    revision=revision,
+                all_files = _list_hub_repo_files(
+                    model_name_or_path, subfolder, use_auth_token, revision, use_cache=use_cache
                 )
-                if subfolder != "":
-                    all_files = [file[len(subfolder) + 1 :] for file in all_files if file.startswith(subfolder)]
             except (RequestsConnectionError, huggingface_hub.utils._http.OfflineModeIsEnabled) as e:
                 request_exception = e
                 object_id = model_name_or_path.replace("/", "--")
@@ -1427,11 +1740,7 @@ class TasksManager:
                             with open(revision_file) as f:
                                 revision = f.read()
                     cached_path = Path(full_model_path, "snapshots", revision, subfolder)
-                    all_files = [
-                        os.path.relpath(os.path.join(dirpath, file), cached_path)
-                        for dirpath, _, filenames in os.walk(cached_path)
-                        for file in filenames
-                    ]
+                    all_files = _list_relative_file_paths(cached_path)
 
         return all_files, request_exception
 
@@ -1448,8 +1757,9 @@ class TasksManager:
         The priority is in the following order:
             1. User input via `framework`.
             2. If local checkpoint is provided, use the same framework as the checkpoint.
-            3. If model repo, try to infer the framework from the cache if available, else from the Hub.
-            4. If could not infer, use available framework in environment, with priority given to PyTorch.
+            3. If model repo and only one of PyTorch and TensorFlow is installed, use it.
+            4. If model repo, try to infer the framework from the cache if available, else from the Hub.
+            5. If could not infer, use available framework in environment, with priority given to PyTorch.
 
         Args:
             model_name_or_path (`Union[str, Path]`):
@@ -1468,32 +1778,42 @@ class TasksManager:
         if framework is not None:
             return framework
 
-        all_files, request_exception = TasksManager.get_model_files(model_name_or_path, subfolder, cache_dir)
-
-        pt_weight_name = Path(WEIGHTS_NAME).stem
-        pt_weight_extension = Path(WEIGHTS_NAME).suffix
-        safe_weight_name = Path(SAFE_WEIGHTS_NAME).stem
-        safe_weight_extension = Path(SAFE_WEIGHTS_NAME).suffix
-        is_pt_weight_file = [
-            (file.startswith(pt_weight_name) and file.endswith(pt_weight_extension))
-            or (file.startswith(safe_weight_name) and file.endswith(safe_weight_extension))
-            for file in all_files
-        ]
+        if not Path(model_name_or_path, subfolder).is_dir():
+            torch_available = is_torch_available()
+            if torch_available != is_tf_available():
+                # The model could only be loaded with the installed framework anyway, no need to query the Hub.
+                framework = "pt" if torch_available else "tf"
+                logger.info(f"Framework not specified. Using {framework} to export the model.")
+                return framework
 
-        weight_name = Path(TF2_WEIGHTS_NAME).stem
-        weight_extension = Path(TF2_WEIGHTS_NAME).suffix
-        is_tf_weight_file = [file.startswith(weight_name) and file.endswith(weight_extension) for file in all_files]
+        all_files, request_exception = TasksManager.get_model_files(
+            model_name_or_path, subfolder, cache_dir, use_cache=True
+        )
 
-        if any(is_pt_weight_file):
+        # Single pass over the files, stopping early on PyTorch weights as they take precedence over everything else.
+        has_pt_weight_file = has_tf_weight_file = has_pt_weight_extension = False
+        has_model_index = has_sentence_transformers_config = False
+        for file in all_files:
+            if _PT_WEIGHT_FILE_PATTERN.fullmatch(file):
+                has_pt_weight_file = True
+                break
+            if _TF_WEIGHT_FILE_PATTERN.fullmatch(file):
+                has_tf_weight_file = True
+            elif file.endswith((_PT_WEIGHT_EXTENSION, _SAFE_WEIGHT_EXTENSION)):
+                has_pt_weight_extension = True
+            elif file == "model_index.json":
+                has_model_index = True
+            elif file == "config_sentence_transformers.json":
+                has_sentence_transformers_config = True
+
+        if has_pt_weight_file:
             framework = "pt"
-        elif any(is_tf_weight_file):
+        elif has_tf_weight_file:
             framework = "tf"
-        elif "model_index.json" in all_files and any(
-            file.endswith((pt_weight_extension, safe_weight_extension)) for file in all_files
-        ):
+        elif has_model_index and has_pt_weight_extension:
             # stable diffusion case
             framework = "pt"
-        elif "config_sentence_transformers.json" in all_files:
+        elif has_sentence_transformers_config:
             # Sentence Transformers libary relies on PyTorch.
             framework = "pt"
         else:
@@ -1504,8 +1824,8 @@ class TasksManager:
             else:
                 raise FileNotFoundError(
                     "Cannot determine framework from given checkpoint location."
-                    f" There should be a {Path(WEIGHTS_NAME).stem}*{Path(WEIGHTS_NAME).suffix} for PyTorch"
-                    f" or {Path(TF2_WEIGHTS_NAME).stem}*{Path(TF2_WEIGHTS_NAME).suffix} for TensorFlow."
+                    f" There should be a {_PT_WEIGHT_NAME}*{_PT_WEIGHT_EXTENSION} for PyTorch"
+                    f" or {_TF_WEIGHT_NAME}*{_TF_WEIGHT_EXTENSION} for TensorFlow."
                 )
 
         if is_torch_available():
@@ -1519,6 +1839,44 @@ class TasksManager:
 
         return framework
 
+    @classmethod
+    def _get_class_name_to_task_indices(cls) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Returns the `auto class name -> task` and `model class name -> task` mappings used to infer the task from a
+        model class. Both are built on first use, and the first model loader matching a name wins.
+        """
+        if cls._CLASS_NAME_TO_TASK_INDICES is None:
+            model_loaders_to_tasks = itertools.chain.from_iterable(
+                model_loader.items()
+                for library_to_model_loaders_to_tasks in (
+                    cls._LIBRARY_TO_MODEL_LOADERS_TO_TASKS_MAP,
+                    cls._LIBRARY_TO_TF_MODEL_LOADERS_TO_TASKS_MAP,
+                )
+                for model_loader in library_to_model_loaders_to_tasks.values()
+            )
+
+            pt_auto_module, tf_auto_module = _get_transformers_auto_modules()
+            auto_class_name_to_task = {}
+            model_class_name_to_task = {}
+            for auto_cls_name, task in model_loaders_to_tasks:
+                auto_class_name_to_task.setdefault(auto_cls_name, task)
+
+                module = tf_auto_module if auto_cls_name.startswith("TF") else pt_auto_module
+                # getattr(module, auto_cls_name)._model_mapping is a _LazyMapping, it also has an attribute called
+                # "_model_mapping" that is what we want here: class names and not actual classes.
+                auto_cls = getattr(module, auto_cls_name, None)
+                # This is the case for StableDiffusionPipeline for instance.
+                if auto_cls is None:
+                    continue
+                for model_class_name in auto_cls._model_mapping._model_mapping.values():
+                    # Some model types map to several classes, given as a tuple: those never matched a class name.
+                    if isinstance(model_class_name, str):
+                        model_class_name_to_task.setdefault(model_class_name, task)
+
+            cls._CLASS_NAME_TO_TASK_INDICES = (auto_class_name_to_task, model_class_name_to_task)
+
+        return cls._CLASS_NAME_TO_TASK_INDICES
+
     @classmethod
     def _infer_task_from_model_or_model_class(
         cls,
@@ -1530,40 +1888,11 @@ class TasksManager:
         if model is None and model_class is None:
             raise ValueError("Either a model or a model class must be provided, but none were given here.")
         target_name = model.__class__.__name__ if model is not None else model_class.__name__
-        task_name = None
-        iterable = ()
-        for _, model_loader in cls._LIBRARY_TO_MODEL_LOADERS_TO_TASKS_MAP.items():
-            iterable += (model_loader.items(),)
-        for _, model_loader in cls._LIBRARY_TO_TF_MODEL_LOADERS_TO_TASKS_MAP.items():
-            iterable += (model_loader.items(),)
-
-        pt_auto_module = importlib.import_module("transformers.models.auto.modeling_auto")
-        tf_auto_module = importlib.import_module("transformers.models.auto.modeling_tf_auto")
-        for auto_cls_name, task in itertools.chain.from_iterable(iterable):
-            if any(
-                (
-                    target_name.startswith("Auto"),
-                    target_name.startswith("TFAuto"),
-                    "StableDiffusion" in target_name,
-                )
-            ):
-                if target_name == auto_cls_name:
-                    task_name = task
-                    break
-
-                continue
-
-            module = tf_auto_module if auto_cls_name.startswith("TF") else pt_auto_module
-            # getattr(module, auto_cls_name)._model_mapping is a _LazyMapping, it also has an attribute called
-            # "_model_mapping" that is what we want here: class names and not actual classes.
-            auto_cls = getattr(module, auto_cls_name, None)
-            # This is the case for StableDiffusionPipeline for instance.
-            if auto_cls is None:
-                continue
-            model_mapping = auto_cls._model_mapping._model_mapping
-            if target_name in model_mapping.values():
-                task_name = task
-                break
+        auto_class_name_to_task, model_class_name_to_task = cls._get_class_name_to_task_indices()
+        if target_name.startswith(("Auto", "TFAuto")) or "StableDiffusion" in target_name:
+            task_name = auto_class_name_to_task.get(target_name)
+        else:
+            task_name = model_class_name_to_task.get(target_name)
         if task_name is None:
             raise ValueError(f"Could not infer the task name for {target_name}.")
 
@@ -1613,32 +1942,48 @@ class TasksManager:
                 # The Hub task "object-detection" is not a supported task per se, as in Transformers this may map to either
                 # zero-shot-object-detection or object-detection.
                 if pipeline_tag is not None and pipeline_tag not in ["conversational", "object-detection"]:
-                    inferred_task_name = TasksManager.map_from_synonym(model_info.pipeline_tag)
+                    inferred_task_name = TasksManager.map_from_synonym(pipeline_tag)
                 else:
                     transformers_info = model_info.transformersInfo
-                    if transformers_info is not None and transformers_info.get("pipeline_tag") is not None:
-                        inferred_task_name = TasksManager.map_from_synonym(transformers_info["pipeline_tag"])
+                    transformers_pipeline_tag = (
+                        transformers_info.get("pipeline_tag") if transformers_info is not None else None
+                    )
+                    if transformers_pipeline_tag is not None:
+                        inferred_task_name = TasksManager.map_from_synonym(transformers_pipeline_tag)
                     else:
                         # transformersInfo does not always have a pipeline_tag attribute
-                        class_name_prefix = ""
-                        if is_torch_available():
-                            tasks_to_automodels = TasksManager._LIBRARY_TO_TASKS_TO_MODEL_LOADER_MAP[library_name]
-                        else:
-                            tasks_to_automodels = TasksManager._LIBRARY_TO_TF_TASKS_TO_MODEL_LOADER_MAP[library_name]
-                            class_name_prefix = "TF"
+                        use_torch = is_torch_available()
+                        class_name_prefix = "" if use_torch else "TF"
 
                         auto_model_class_name = transformers_info["auto_model"]
                         if not auto_model_class_name.startswith("TF"):
                             auto_model_class_name = f"{class_name_prefix}{auto_model_class_name}"
-                        for task_name, class_name_for_task in tasks_to_automodels.items():
-                            if class_name_for_task == auto_model_class_name:
-                                inferred_task_name = task_name
-                                break
+                        inferred_task_name = TasksManager._get_auto_model_class_name_to_task(
+                            library_name, use_torch
+                        ).get(auto_model_class_name)
 
         if inferred_task_name is None:
             raise KeyError(f"Could not find the proper task name for {auto_model_class_name}.")
         return inferred_task_name
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_auto_model_class_name_to_task(library_name: str, use_torch: bool) -> Dict[str, str]:
+        """
+        Returns the `auto model class name -> task` mapping for the library, the first task wins.
+        """
+        if use_torch:
+            tasks_to_automodels = TasksManager._LIBRARY_TO_TASKS_TO_MODEL_LOADER_MAP[library_name]
+        else:
+            tasks_to_automodels = TasksManager._LIBRARY_TO_TF_TASKS_TO_MODEL_LOADER_MAP[library_name]
+
+        auto_model_class_name_to_task = {}
+        for task_name, class_name_for_task in tasks_to_automodels.items():
+            # Tasks mapping to several auto classes (tuples) never matched a single class name.
+            if isinstance(class_name_for_task, str):
+                auto_model_class_name_to_task.setdefault(class_name_for_task, task_name)
+        return auto_model_class_name_to_task
+
     @classmethod
     def infer_task_from_model(
         cls,
@@ -1661,21 +2006,73 @@ class TasksManager:
         Returns:
             `str`: The task name automatically detected from the model repo.
         """
-        is_torch_pretrained_model = is_torch_available() and isinstance(model, PreTrainedModel)
-        is_tf_pretrained_model = is_tf_available() and isinstance(model, TFPreTrainedModel)
+        # Repo names and model classes are handled first, the model base classes only need to be imported otherwise.
         task = None
         if isinstance(model, str):
             task = cls._infer_task_from_model_name_or_path(model, subfolder=subfolder, revision=revision)
-        elif is_torch_pretrained_model or is_tf_pretrained_model:
-            task = cls._infer_task_from_model_or_model_class(model=model)
         elif inspect.isclass(model):
             task = cls._infer_task_from_model_or_model_class(model_class=model)
+        else:
+            is_torch_pretrained_model = False
+            if is_torch_available():
+                from transformers import PreTrainedModel
+
+                is_torch_pretrained_model = isinstance(model, PreTrainedModel)
+
+            is_tf_pretrained_model = False
+            if not is_torch_pretrained_model and is_tf_available():
+                from transformers import TFPreTrainedModel
+
+                is_tf_pretrained_model = isinstance(model, TFPreTrainedModel)
+
+            if is_torch_pretrained_model or is_tf_pretrained_model:
+                task = cls._infer_task_from_model_or_model_class(model=model)
 
         if task is None:
             raise ValueError(f"Could not infer the task from {model}.")
 
         return task
 
+    @classmethod
+    def infer_tasks_from_models(
+        cls,
+        models: Iterable[str],
+        subfolder: str = "",
+        revision: Optional[str] = None,
+        max_workers: int = 16,
+    ) -> List[str]:
+        """
+        Infers the tasks from several model repos, querying the Hugging Face Hub concurrently.
+
+        Args:
+            models (`Iterable[str]`):
+                The names of the repos on the Hugging Face Hub to infer the tasks from.
+            subfolder (`str`, *optional*, defaults to `""`):
+                In case the model files are located inside a subfolder of the model directory / repo on the Hugging
+                Face Hub, you can specify the subfolder name here.
+            revision (`Optional[str]`,  defaults to `None`):
+                Revision is the specific model version to use. It can be a branch name, a tag name, or a commit id.
+            max_workers (`int`, defaults to `16`):
+                The maximum number of concurrent requests to the Hugging Face Hub.
+        Returns:
+            `List[str]`: The task names automatically detected from the model repos, in the same order as `models`.
+        """
+        models = list(models)
+        # Each repo is only queried once, duplicates are answered from the results.
+        unique_models = list(dict.fromkeys(models))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tasks = dict(
+                zip(
+                    unique_models,
+                    executor.map(
+                        lambda model: cls.infer_task_from_model(model, subfolder=subfolder, revision=revision),
+                        unique_models,
+                    ),
+                )
+            )
+
+        return [tasks[model] for model in models]
+
     @staticmethod
     def _infer_library_from_model(
         model: Union["PreTrainedModel", "TFPreTrainedModel"], library_name: Optional[str] = None
@@ -1733,8 +2130,10 @@ class TasksManager:
             return library_name
 
         all_files, _ = TasksManager.get_model_files(
-            model_name_or_path, subfolder, cache_dir, use_auth_token=use_auth_token
+            model_name_or_path, subfolder, cache_dir, use_auth_token=use_auth_token, use_cache=True
         )
+        # Several file names are looked up below.
+        all_files = frozenset(all_files)
 
         if "model_index.json" in all_files:
             library_name = "diffusers"
@@ -1751,12 +2150,12 @@ class TasksManager:
                 "cache_dir": cache_dir,
                 "use_auth_token": use_auth_token,
             }
-            config_dict, kwargs = PretrainedConfig.get_config_dict(model_name_or_path, **kwargs)
-            model_config = PretrainedConfig.from_dict(config_dict, **kwargs)
+            config_dict, _ = PretrainedConfig.get_config_dict(model_name_or_path, **kwargs)
 
-            if hasattr(model_config, "pretrained_cfg") or hasattr(model_config, "architecture"):
+            # Only the keys of the configuration are needed, no need to instantiate it.
+            if "pretrained_cfg" in config_dict or "architecture" in config_dict:
                 library_name = "timm"
-            elif hasattr(model_config, "_diffusers_version"):
+            elif "_diffusers_version" in config_dict:
                 library_name = "diffusers"
             else:
                 library_name = "transformers"
@@ -1830,19 +2229,17 @@ class TasksManager:
         Returns:
             `List`: all the possible tasks.
         """
-        tasks = []
-        if is_torch_available():
+        return list(TasksManager._get_all_tasks(is_torch_available()))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_all_tasks(use_torch: bool) -> Tuple[str, ...]:
+        if use_torch:
             mapping = TasksManager._LIBRARY_TO_TASKS_TO_MODEL_LOADER_MAP
         else:
             mapping = TasksManager._LIBRARY_TO_TF_TASKS_TO_MODEL_LOADER_MAP
 
-        tasks = []
-        for d in mapping.values():
-            tasks += list(d.keys())
-
-        tasks = list(set(tasks))
-
-        return tasks
+        return tuple(set().union(*mapping.values()))
 
     @staticmethod
     def get_model_from_task(
@@ -1906,7 +2303,12 @@ class TasksManager:
 
         if library_name == "transformers":
             config = AutoConfig.from_pretrained(model_name_or_path, **kwargs)
-            model_type = config.model_type.replace("_", "-")
+            if not any(hasattr(config, key) for key in model_kwargs):
+                # Reuse the configuration instead of loading it again in `from_pretrained`. Keyword arguments
+                # overriding configuration attributes can not be passed along with a configuration, in which case
+                # `from_pretrained` loads it.
+                kwargs["config"] = config
+            model_type = _normalize_model_type(config.model_type)
             # TODO: if automatic-speech-recognition is passed as task, it may map to several
             # different auto class (AutoModelForSpeechSeq2Seq or AutoModelForCTC),
             # depending on the model type
@@ -2002,17 +2404,7 @@ class TasksManager:
             logger.warning(
                 "Passing the argument `library_name` to `get_supported_tasks_for_model_type` is required, but got library_name=None. Defaulting to `transformers`. An error will be raised in a future version of Optimum if `library_name` is not provided."
             )
-
-            # We are screwed if different dictionaries have the same keys.
-            supported_model_type_for_library = {
-                **TasksManager._DIFFUSERS_SUPPORTED_MODEL_TYPE,
-                **TasksManager._TIMM_SUPPORTED_MODEL_TYPE,
-                **TasksManager._SENTENCE_TRANSFORMERS_SUPPORTED_MODEL_TYPE,
-                **TasksManager._SUPPORTED_MODEL_TYPE,
-            }
             library_name = "transformers"
-        else:
-            supported_model_type_for_library = TasksManager._LIBRARY_TO_SUPPORTED_MODEL_TYPES[library_name]
 
         if model is None and model_type is None:
             raise ValueError("Either a model_type or model should be provided to retrieve the export config.")
@@ -2027,7 +2419,7 @@ class TasksManager:
             if model_type is None:
                 raise ValueError("Model type cannot be inferred. Please provide the model_type for the model!")
 
-            model_type = model_type.replace("_", "-")
+            model_type = _normalize_model_type(model_type)
             model_name = getattr(model, "name", model_name)
 
         model_tasks = TasksManager.get_supported_tasks_for_model_type(
@@ -2046,10 +2438,8 @@ class TasksManager:
                     f" Supported tasks are: {', '.join(model_tasks.keys())}."
                 )
 
-        if model_type not in supported_model_type_for_library:
-            model_type = TasksManager._MODEL_TYPE_FOR_DEFAULT_CONFIG[library_name]
-
-        exporter_config_constructor = supported_model_type_for_library[model_type][exporter][task]
+        # `model_tasks` is already the mapping for the resolved model type and exporter, no need to look it up again.
+        exporter_config_constructor = model_tasks[task]
         if exporter_config_kwargs is not None:
             exporter_config_constructor = partial(exporter_config_constructor, **exporter_config_kwargs)
 
@@ -545,11 +545,7 @@ def _get_submodels_and_export_configs(
             logger.info(f"Using the export variant {export_config.variant}. Available variants are:\n{all_variants}")
 
             # TODO: this succession of if/else strongly suggests a refactor is needed.
-            if (
-                model.config.is_encoder_decoder
-                and task.startswith(TasksManager._ENCODER_DECODER_TASKS)
-                and not monolith
-            ):
+            if model.config.is_encoder_decoder and TasksManager._is_encoder_decoder_task(task) and not monolith:
                 models_and_export_configs = get_encoder_decoder_models_for_export(model, export_config)
             elif task.startswith("text-generation") and not monolith:
                 models_and_export_configs = get_decoder_models_for_export(model, export_config, legacy=legacy)
@@ -576,11 +572,7 @@ def _get_submodels_and_export_configs(
         else:
             if library_name == "diffusers":
                 submodels_for_export = _get_submodels_for_export_stable_diffusion(model)
-            elif (
-                model.config.is_encoder_decoder
-                and task.startswith(TasksManager._ENCODER_DECODER_TASKS)
-                and not monolith
-            ):
+            elif model.config.is_encoder_decoder and TasksManager._is_encoder_decoder_task(task) and not monolith:
                 submodels_for_export = _get_submodels_for_export_encoder_decoder(
                     model, use_past=task.endswith("-with-past")
                 )
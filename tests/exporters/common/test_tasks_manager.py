@@ -14,14 +14,20 @@
 # limitations under the License.
 import importlib
 import inspect
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Optional, Set
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from transformers import BertConfig, Pix2StructForConditionalGeneration, VisualBertForQuestionAnswering
 from transformers.testing_utils import slow
 
 from optimum.exporters import TasksManager
+from optimum.exporters import tasks as tasks_module
 from optimum.exporters.onnx.model_configs import BertOnnxConfig
 
 
@@ -78,6 +84,48 @@ class TasksManagerTestCase(TestCase):
     def test_all_tflite_models_are_registered(self):
         return self._check_all_models_are_registered("tflite", "TFLiteConfig")
 
+    def test_all_supported_model_types_are_resolvable(self):
+        for library_name, supported_model_types in TasksManager._LIBRARY_TO_SUPPORTED_MODEL_TYPES.items():
+            for model_type, mappings in supported_model_types.items():
+                for backend in mappings:
+                    for task, constructor in mappings[backend].items():
+                        self.assertTrue(
+                            inspect.isclass(constructor.func),
+                            f"Could not resolve the {backend} config for {model_type} ({library_name}) and {task}.",
+                        )
+
+    def test_backend_model_configs_are_lazily_imported(self):
+        code = (
+            "import sys\n"
+            "from optimum.exporters.tasks import TasksManager\n"
+            "assert 'optimum.exporters.onnx.model_configs' not in sys.modules\n"
+            "TasksManager._SUPPORTED_MODEL_TYPE['bert']['onnx']\n"
+            "assert 'optimum.exporters.onnx.model_configs' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_supported_model_type_for_task_does_not_load_backends(self):
+        code = (
+            "import sys\n"
+            "from optimum.exporters.tasks import TasksManager\n"
+            "assert 'bert' in TasksManager.get_supported_model_type_for_task('fill-mask', 'onnx')\n"
+            "assert 'optimum.exporters.onnx.model_configs' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_supported_model_type_for_task_lists_model_types_once(self):
+        # RoFormer declares "token-classification" twice, it should still only be listed once.
+        model_types = TasksManager.get_supported_model_type_for_task("token-classification", "onnx")
+        self.assertEqual(model_types.count("roformer"), 1)
+
+        for task in ["token-classification", "text-classification", "feature-extraction"]:
+            expected = [
+                model_type.replace("-", "_")
+                for model_type, mapping in TasksManager._SUPPORTED_MODEL_TYPE.items()
+                if task in mapping.get("onnx", {}).keys()
+            ]
+            self.assertEqual(TasksManager.get_supported_model_type_for_task(task, "onnx"), expected)
+
     def test_register(self):
         # Case 1: We try to register a config that was already registered, it should not register anything.
         register_for_onnx = TasksManager.create_register("onnx")
@@ -187,3 +235,135 @@ class TasksManagerTestCase(TestCase):
         )
         self.assertEqual(TasksManager.infer_library_from_model("gpt2"), "transformers")
         self.assertEqual(TasksManager.infer_library_from_model("timm/mobilenetv3_large_100.ra_in1k"), "timm")
+
+    def test_infer_tasks_from_models(self):
+        model_to_task = {"org/bert": "fill-mask", "org/gpt2": "text-generation", "org/t5": "text2text-generation"}
+
+        def infer_task(model_name_or_path, subfolder="", revision=None):
+            if model_name_or_path == "org/broken":
+                raise KeyError(f"Could not find the proper task name for {model_name_or_path}.")
+            return model_to_task[model_name_or_path]
+
+        with mock.patch.object(
+            TasksManager, "_infer_task_from_model_name_or_path", side_effect=infer_task
+        ) as infer_task_mock:
+            models = ["org/gpt2", "org/bert", "org/gpt2", "org/t5", "org/bert"]
+            self.assertEqual(
+                TasksManager.infer_tasks_from_models(models, max_workers=4),
+                [model_to_task[model] for model in models],
+            )
+            # Each repo is only queried once.
+            self.assertEqual(
+                sorted(call.args[0] for call in infer_task_mock.call_args_list), ["org/bert", "org/gpt2", "org/t5"]
+            )
+
+            with self.assertRaises(KeyError):
+                TasksManager.infer_tasks_from_models(["org/bert", "org/broken", "org/t5"])
+
+    def test_library_detection_after_failed_hub_request(self):
+        # A result inferred while the Hub was unreachable should not be reused once it is reachable again.
+        with mock.patch.object(
+            TasksManager,
+            "get_model_files",
+            side_effect=[([], RequestsConnectionError()), (["model_index.json"], None)],
+        ):
+            self.assertEqual(TasksManager.infer_library_from_model("org/model"), "transformers")
+            self.assertEqual(TasksManager.infer_library_from_model("org/model"), "diffusers")
+
+    def test_get_model_files_local_directory(self):
+        with TemporaryDirectory() as tmpdirname:
+            for file_name in ["config.json", "model.safetensors", "unet/diffusion_pytorch_model.bin", "a/b/c.txt"]:
+                file_path = Path(tmpdirname, file_name)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.touch()
+
+            all_files, request_exception = TasksManager.get_model_files(tmpdirname)
+            self.assertIsNone(request_exception)
+            self.assertEqual(
+                sorted(all_files),
+                sorted(["config.json", "model.safetensors", "unet/diffusion_pytorch_model.bin", "a/b/c.txt"]),
+            )
+
+            all_files, _ = TasksManager.get_model_files(tmpdirname, subfolder="unet")
+            self.assertEqual(all_files, ["diffusion_pytorch_model.bin"])
+
+    def test_get_model_files_hub_listing_cache(self):
+        repo_files = ["config.json", "model.safetensors"]
+        with mock.patch.dict(tasks_module._HUB_REPO_FILES_CACHE, clear=True), mock.patch.object(
+            tasks_module.huggingface_hub, "list_repo_files", return_value=repo_files
+        ) as list_repo_files, mock.patch.object(tasks_module.time, "monotonic", return_value=0.0) as monotonic:
+            # The public listing always requests the Hub unless asked otherwise.
+            TasksManager.get_model_files("org/model")
+            TasksManager.get_model_files("org/model")
+            self.assertEqual(list_repo_files.call_count, 2)
+
+            all_files, request_exception = TasksManager.get_model_files("org/model", use_cache=True)
+            self.assertEqual(all_files, repo_files)
+            self.assertIsNone(request_exception)
+            self.assertEqual(list_repo_files.call_count, 2)
+
+            # Listings are requested again once expired.
+            monotonic.return_value = tasks_module._HUB_REPO_FILES_CACHE_TTL + 1.0
+            TasksManager.get_model_files("org/model", use_cache=True)
+            self.assertEqual(list_repo_files.call_count, 3)
+
+            # Failed requests are not cached.
+            list_repo_files.side_effect = RequestsConnectionError()
+            with self.assertRaises(RequestsConnectionError):
+                tasks_module._list_hub_repo_files("org/other-model", use_cache=True)
+            self.assertNotIn(("org/other-model", "", None, None), tasks_module._HUB_REPO_FILES_CACHE)
+
+            # The number of cached listings is bounded.
+            list_repo_files.side_effect = None
+            for i in range(tasks_module._HUB_REPO_FILES_CACHE_MAXSIZE + 1):
+                TasksManager.get_model_files(f"org/model-{i}", use_cache=True)
+            self.assertEqual(len(tasks_module._HUB_REPO_FILES_CACHE), tasks_module._HUB_REPO_FILES_CACHE_MAXSIZE)
+            self.assertNotIn(("org/model", "", None, None), tasks_module._HUB_REPO_FILES_CACHE)
+
+    def test_determine_framework_local_checkpoint(self):
+        for file_names, expected_framework in [
+            (["config.json", "pytorch_model-00001-of-00002.bin"], "pt"),
+            (["config.json", "model.safetensors"], "pt"),
+            (["config.json", "tf_model.h5"], "tf"),
+            (["model_index.json", "unet/diffusion_pytorch_model.safetensors"], "pt"),
+            (["config.json", "config_sentence_transformers.json"], "pt"),
+        ]:
+            with TemporaryDirectory() as tmpdirname:
+                for file_name in file_names:
+                    file_path = Path(tmpdirname, file_name)
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    file_path.touch()
+                self.assertEqual(TasksManager.determine_framework(tmpdirname), expected_framework)
+
+        with TemporaryDirectory() as tmpdirname:
+            Path(tmpdirname, "config.json").touch()
+            with self.assertRaises(FileNotFoundError):
+                TasksManager.determine_framework(tmpdirname)
+
+    def test_determine_framework_single_installed_framework(self):
+        get_model_files = TasksManager.get_model_files
+        for torch_available, tf_available, expected_framework in [(True, False, "pt"), (False, True, "tf")]:
+            with mock.patch.object(
+                tasks_module, "is_torch_available", return_value=torch_available
+            ), mock.patch.object(tasks_module, "is_tf_available", return_value=tf_available), mock.patch.object(
+                TasksManager, "get_model_files", wraps=get_model_files
+            ) as get_model_files_mock:
+                # The Hub repository is not listed when only one framework can load the model anyway.
+                self.assertEqual(TasksManager.determine_framework("org/model"), expected_framework)
+                get_model_files_mock.assert_not_called()
+
+                # Local checkpoints are still inspected.
+                with TemporaryDirectory() as tmpdirname:
+                    Path(tmpdirname, "config.json").touch()
+                    Path(tmpdirname, "tf_model.h5").touch()
+                    self.assertEqual(TasksManager.determine_framework(tmpdirname), "tf")
+                get_model_files_mock.assert_called_once()
+
+        # With both frameworks installed, the Hub repository files decide.
+        with mock.patch.object(tasks_module, "is_torch_available", return_value=True), mock.patch.object(
+            tasks_module, "is_tf_available", return_value=True
+        ), mock.patch.object(
+            TasksManager, "get_model_files", return_value=(["config.json", "tf_model.h5"], None)
+        ) as get_model_files_mock:
+            self.assertEqual(TasksManager.determine_framework("org/model"), "tf")
+            get_model_files_mock.assert_called_once()